@@ -4,17 +4,19 @@ import discord
 import aiohttp
 import asyncio
 import logging
+import os
 
 from discord.ext import commands, tasks
 from discord import Emoji, Reaction, PartialEmoji, app_commands
 from motor.motor_asyncio import AsyncIOMotorClient
 from aiohttp import web
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Union
 from collections import namedtuple
 
 from . import config, database as db
-from .cache import TTLCache, CachedCommandTree
+from .cache import TimerCache, LRUCache, CachedCommandTree
 from .cogs.help import FullHelpCommand
 from .cogs.utils import errors, checks
 from .resources import EMOJIS
@@ -51,8 +53,13 @@ class Mushmom(commands.Bot):
     ----------
     session: aiohttp.ClientSession
         client for making async http requests
-    info_cache: TTLCache
-        an expiring cache of info msg that can be reacted to for fame
+    info_cache: TimerCache
+        an expiring cache of info msg (with its shown fame and member)
+        that can be reacted to for fame
+    sprite_cache: LRUCache
+        rendered info sprites keyed by a hash of the character data
+    executor: ThreadPoolExecutor
+        threads for CPU bound image work, kept off the event loop
     db: AsyncIOMotorDatabase
         the MongoDB database holding collections
 
@@ -77,7 +84,10 @@ class Mushmom(commands.Bot):
             default=aiohttp.http.SERVER_SOFTWARE
         )
 
-        self.info_cache = TTLCache(seconds=86400, max_size=1000)
+        self.info_cache = TimerCache(seconds=86400, max_size=1000)
+        self.sprite_cache = LRUCache(max_size=2048)
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                           thread_name_prefix='mushmom-img')
         self.db = db.Database(db_client)
 
         # add global checks
@@ -94,7 +104,8 @@ class Mushmom(commands.Bot):
                 loop=self.loop,
                 headers={
                     'User-Agent': self.user_agent
-                }
+                },
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
             )
 
         # set owner. assume not team
@@ -350,7 +361,6 @@ class Mushmom(commands.Bot):
     @tasks.loop(minutes=10)
     async def prune_caches(self):
         """Clean up stray cached data"""
-        self.info_cache.prune()
         self.db.user_cache.prune()
 
     async def close(self):
@@ -359,3 +369,4 @@ class Mushmom(commands.Bot):
         await super().close()
         await self.session.close()
         self.db.close()
+        self.executor.shutdown(wait=False)
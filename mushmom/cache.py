@@ -6,6 +6,7 @@ Expiring caches.  CachedCommandTree from
 from __future__ import annotations
 
 import time
+import asyncio
 from typing import Any, Hashable, Dict, Optional, List, TYPE_CHECKING, Union
 from collections import OrderedDict
 
@@ -150,6 +151,61 @@ class LRUCache:
         return iter(self.__cache)
 
 
+class TimerCache:
+    """
+    Entries are evicted by a timer on the event loop when they expire, so
+    there is nothing to prune.  Adding an existing key restarts its timer.
+    Must be added to from within a running event loop
+
+    Parameters
+    ----------
+    seconds: int
+        the number of seconds to wait before expiring
+    max_size: Optional[int]
+        max number of entries. oldest are evicted first
+
+    """
+    def __init__(self, seconds: int, max_size: Optional[int] = None):
+        self.__ttl = seconds
+        self.__cache = {}  # k: (value, asyncio.TimerHandle)
+        self.__max_size = max_size
+
+    def get(self, k: Hashable) -> Any:
+        if k in self.__cache:
+            return self.__cache[k][0]
+
+    def add(self, k: Hashable, value: Any) -> None:
+        self.remove(k)  # cancel old timer and move to end
+        loop = asyncio.get_running_loop()
+        handle = loop.call_later(self.__ttl, self.__cache.pop, k, None)
+        self.__cache[k] = (value, handle)
+
+        # cap at max_size. oldest first
+        n = self.__max_size
+        while n is not None and len(self.__cache) > n:
+            self.remove(next(iter(self.__cache)))
+
+    def remove(self, k: Hashable) -> None:
+        if k in self.__cache:
+            _, handle = self.__cache.pop(k)
+            handle.cancel()
+
+    def clear(self) -> None:
+        for _, handle in self.__cache.values():
+            handle.cancel()
+
+        self.__cache = {}
+
+    def contains(self, k: Hashable) -> bool:
+        return k in self.__cache
+
+    def __contains__(self, k: Hashable) -> bool:
+        return self.contains(k)
+
+    def __iter__(self):
+        return iter(self.__cache)
+
+
 class CachedCommandTree(app_commands.CommandTree):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
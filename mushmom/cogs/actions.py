@@ -129,7 +129,7 @@ class Actions(commands.Cog):
 
         if bg in BACKGROUNDS:
             attm, y_ground = BACKGROUNDS[bg]
-            bg = await self.bot.download(attm.url)
+            bg = imutils.open_rgba(await self.bot.download(attm.url))
 
         # gen final frame
         final = []
@@ -144,8 +144,8 @@ class Actions(commands.Cog):
             new.paste(cropped, ul)
 
             # add background
-            data = imutils.apply_background(new, bg, y_feet, y_ground)
-            final.append(Image.open(BytesIO(data)))
+            final.append(imutils.apply_background(new, bg, y_feet, y_ground,
+                                                  return_image=True))
 
         # save
         byte_arr = BytesIO()
@@ -154,7 +154,8 @@ class Actions(commands.Cog):
 
         # send embed
         filename = f'{interaction.command.name}.gif'
-        img = discord.File(fp=BytesIO(byte_arr.getvalue()), filename=filename)
+        byte_arr.seek(0)
+        img = discord.File(fp=byte_arr, filename=filename)
 
         embed = discord.Embed(description=desc,
                               color=config.core.embed_color)
@@ -178,8 +179,9 @@ class Actions(commands.Cog):
         # create output
         out = Image.new('RGBA', (int(width * 1.5), width * 2), (0,)*4)
         out.paste(pfp, (width//2, 0), mask=pfp)
+        # decoded again right away, so favor encode speed over size
         byte_arr = BytesIO()
-        out.save(byte_arr, format='PNG')
+        out.save(byte_arr, format='PNG', compress_level=1)
         return byte_arr.getvalue()
 
     async def weapon_width(
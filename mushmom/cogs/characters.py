@@ -64,7 +64,7 @@ class Characters(commands.Cog):
         if url:  # maplestory.io char api
             parser = Character.from_url
             src = url
-        elif json.filename.endswith('.json'):  # json output of sim and studio
+        elif json.filename.lower().endswith('.json'):  # json output of sim and studio
             parser = Character.from_json
             src = await self.bot.download(json.url, errors.DiscordIOError)
         else:
@@ -87,8 +87,9 @@ class Characters(commands.Cog):
         else:
             # check if char exists
             chars = user['chars']
-            _iter = (i for i, c in enumerate(chars) if c['name'] == name)
-            i = next(_iter, None)
+            max_chars = config.core.max_chars
+            by_name = {c['name']: i for i, c in enumerate(chars)}
+            i = by_name.get(name)
 
             if i is not None:  # exists; prompt if want to replace
                 text = f'**{name}** already exists. Replace?'
@@ -98,35 +99,37 @@ class Characters(commands.Cog):
                     return
 
                 char.copy_info(chars[i])
-                chars[i] = char.to_dict()
-            elif len(user['chars']) < config.core.max_chars:  # has empty space
-                i = len(user['chars'])
-                chars.append(char.to_dict())
+            elif len(chars) < max_chars:  # has empty space
+                i = len(chars)
             else:  # too many chars; replace?
                 title = 'Max Characters Reached'
                 text = (f'{config.core.bot_name} can only save '
-                        f'{config.core.max_chars} character(s). Choose a '
+                        f'{max_chars} character(s). Choose a '
                         'character to replace.')
                 i = await io.get_char_index(interaction, user,
                                             title=title, text=text)
 
-                if i is not None:
-                    chars[i] = char.to_dict()
-                else:
+                if i is None:
                     text = f'**{name}** was not saved'
                     await self.bot.followup(interaction, content=text, view=None)
                     return
 
-            update = {'chars': chars}
-
             # set default?
+            update = {}
             if i != user['default']:
                 text = f'Do you want to set {name} as default?'
                 if await io.confirm_prompt(interaction, text):
-                    update.update({'default': i})
+                    update['default'] = i
+
+            # update database. only send the affected char
+            char_data = char.to_dict()
 
-            # update database
-            ret = await self.bot.db.set_user(interaction.user.id, update)
+            if i == len(chars):
+                ret = await self.bot.db.push_char(interaction.user.id,
+                                                  char_data, update)
+            else:
+                ret = await self.bot.db.replace_char(interaction.user.id, i,
+                                                     char_data, update)
 
         if ret and ret.acknowledged:
             text = f'**{name}** has been successfully mushed'
@@ -103,7 +103,7 @@ class Help(commands.Cog):
         embed.set_author(name=f'About {config.core.bot_name}',
                          icon_url=self.bot.user.display_avatar.url)
         embed.set_footer(text=f'v{config.core.version}')
-        thumbnail = self.bot.get_emoji(EMOJIS['mushparty'].id).url
+        thumbnail = EMOJIS['mushparty'].url
         embed.set_thumbnail(url=thumbnail)
         embed.set_image(url=ATTACHMENTS['mushmomheader'].url)
 
@@ -121,7 +121,7 @@ class Help(commands.Cog):
 
         embed.set_author(name=f'{config.core.bot_name} Admin',
                          icon_url=self.bot.user.display_avatar.url)
-        thumbnail = self.bot.get_emoji(EMOJIS['mushcheers'].id).url
+        thumbnail = EMOJIS['mushcheers'].url
         embed.set_thumbnail(url=thumbnail)
 
         embed.add_field(
@@ -175,7 +175,7 @@ class Help(commands.Cog):
         embed.set_author(name=f'{config.core.bot_name}',
                          icon_url=self.bot.user.display_avatar.url)
         embed.set_footer(text=f'v{config.core.version}')
-        thumbnail = self.bot.get_emoji(EMOJIS['mushcheers'].id).url
+        thumbnail = EMOJIS['mushcheers'].url
         embed.set_thumbnail(url=thumbnail)
         embed.set_image(url=ATTACHMENTS['mushmomheader'].url)
 
@@ -5,22 +5,26 @@ Character profiles
 import discord
 import asyncio
 import re
+import time
+import hashlib
+import orjson
 
 from discord import app_commands
 from discord.ext import commands
 from io import BytesIO
-from PIL import Image
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 from typing import Optional, Union
 from aenum import Enum
-from collections import namedtuple
+from collections import namedtuple, deque
+from itertools import chain
 from urllib.parse import urlparse, parse_qsl
 
 from .. import config, mapleio
 from .utils import errors
 from .utils.parameters import contains
 from .utils.checks import slash_in_guild_channel
+from ..cache import LRUCache, TTLCache
 from ..mapleio import imutils
 from ..mapleio.character import Character
 
@@ -29,6 +33,25 @@ from ..resources import EMOJIS, ATTACHMENTS, BACKGROUNDS
 UTC = timezone.utc
 NYC = ZoneInfo('America/New_York')  # new york timezone
 Games = Enum('Games', zip(mapleio.GAMES, mapleio.GAMES))
+VALID_JOBS = frozenset(mapleio.JOBS)
+VALID_GAMES = frozenset(x.name for x in Games)
+VALID_SERVERS = frozenset(mapleio.SERVERS)
+BackgroundTile = namedtuple('BackgroundTile', 'image y_ground x_pad')
+InfoData = namedtuple('InfoData', 'message fame target')  # info_cache values
+FAME_NUM_RE = re.compile(r'-?\d+')  # fame count in info embed
+
+# thumbs up/down reactions, and custom emoji names that count as them
+THUMBS_UP = '\U0001f44D'
+THUMBS_DOWN = '\U0001f44E'
+THUMBS_UP_WORDS = ('thumb', 'up')
+THUMBS_DOWN_WORDS = ('thumb', 'down')
+INFO_FIELDS = (  # (label, key) shown in info embed
+    ('Name', 'name'),
+    ('Job', 'job'),
+    ('Game', 'game'),
+    ('Server', 'server'),
+    ('Guild', 'guild')
+)
 
 
 def utc(ts):
@@ -53,6 +76,31 @@ class Info(commands.Cog):
         )
         self.bot.tree.add_command(self._info_context_menu)
 
+        # cropped backgrounds. (bg, w, h): BackgroundTile. bg can be any
+        # url, so expire them rather than hold every one forever
+        self._bg_tiles = TTLCache(seconds=86400, max_size=32)
+        self._bg_pending = {}  # (bg, w, h): Task. one download per key
+        self._notfound_pfp = None  # generated pfp for members w/o chars
+        self._pfp_cache = LRUCache(max_size=256)  # (char hash, bg): bytes
+
+    async def cog_load(self):
+        # warm background tiles without holding up startup
+        self._preload_task = asyncio.create_task(self._preload_backgrounds())
+
+    async def cog_unload(self):
+        self._preload_task.cancel()
+
+    async def _preload_backgrounds(self) -> None:
+        """
+        Download and crop every known background at the default size. A
+        failed download is ignored and retried lazily by _get_background
+
+        """
+        await asyncio.gather(
+            *(self._get_background(bg) for bg in BACKGROUNDS),
+            return_exceptions=True
+        )
+
     @app_commands.command()
     @slash_in_guild_channel()
     async def info(
@@ -74,6 +122,9 @@ class Info(commands.Cog):
         if not member:
             member = interaction.user
 
+        if member.bot:  # can never have chars; skip db and render
+            raise errors.BadArgument('Bots do not have profiles')
+
         msg = f'{config.core.bot_name} is thinking'
         await self.bot.defer(interaction, msg=msg, ephemeral=False)
 
@@ -81,9 +132,8 @@ class Info(commands.Cog):
             title=f'{member.name}#{member.discriminator}',
             color=config.core.embed_color
         )
-        mushshine = self.bot.get_emoji(EMOJIS['mushshine'].id).url
         embed.set_author(name=f'{member.display_name}\'s Info',
-                         icon_url=mushshine)
+                         icon_url=EMOJIS['mushshine'].url)
         thumb = member.display_avatar.url  # hide id in thumb url
         thumb += ('&' if urlparse(thumb).query else '?') + f'uid={member.id}'
         embed.set_thumbnail(url=thumb)
@@ -99,87 +149,51 @@ class Info(commands.Cog):
             else:
                 char = user['chars'][user['default']]
 
-        char_info = {
-            'name': char.get('name') or '-',
-            'job': char.get('job') or '-',
-            'game': char.get('game') or '-',
-            'server': char.get('server') or '-',
-            'guild': char.get('guild') or '-'
-        }
         fame = user.get('fame', 0)
 
         # format info
-        _fmt_info = [_padded_str(f'> **{k.title()}**: {v}')
-                     for k, v in char_info.items()]
+        _fmt_info = [_padded_str(f'> **{label}**: {char.get(k) or "-"}')
+                     for label, k in INFO_FIELDS]
         embed.add_field(name='Active Character',
                         value='\n'.join(_fmt_info) + '\n\u200b')
         _fmt_fame = _padded_str(f'\u2b50 {fame}', n=12)
         embed.add_field(name='Fame', value=_fmt_fame + '\n\u200b')
 
-        # send placeholder pfp in 3 seconds
-        embed.set_image(url=ATTACHMENTS['pfp_loading'].url)
-        embed.set_footer(text='Still loading profile picture')
-        temp_send_task = self.bot.loop.create_task(
-            self._delayed_send(interaction, content='', embed=embed)
-        )
+        # build pfp. only send a placeholder if it is slow. cached pfps
+        # finish before the wait yields, so never get a placeholder
+        pfp_task = asyncio.create_task(self._build_pfp(char))
+        delay = config.core.pfp_loading_delay
+        done, _ = await asyncio.wait({pfp_task}, timeout=delay)
 
-        # get real pfp
-        if not char:
-            attm = ATTACHMENTS['mushcharnotfound']
-            filename = attm.filename
+        if pfp_task not in done:
+            temp_embed = embed.copy()  # final embed stays untouched
+            temp_embed.set_image(url=ATTACHMENTS['pfp_loading'].url)
+            temp_embed.set_footer(text='Still loading profile picture')
+            await self.bot.followup(interaction, content='', embed=temp_embed)
 
-            try:
-                data = await self.bot.download(attm.url, errors.DiscordIOError)
-            except errors.DiscordIOError:
-                data = None
+        pfp_data, filename = await pfp_task
+        pfp = discord.File(fp=pfp_data, filename=filename) if pfp_data else None
 
+        if not char:
             embed.set_footer(text='This member has no registered characters')
         else:
-            filename = f'{char.get("name") or "char"}.png'
-            data = await mapleio.api.get_sprite(
-                Character.from_json(char), render_mode='FeetCenter')
-
             embed.set_footer(text='React with \U0001f44D \u200b to fame')
 
-        if data:  # successful get
-            pfp_data = await self.gen_profile_pic(data)
-            pfp = discord.File(fp=BytesIO(pfp_data), filename=filename)
-        else:
-            pfp = None
-
-        # cancel if not yet sent, else edit
+        # attach pfp directly. edit also replaces placeholder if sent
         args = dict(content='', embed=embed)
 
-        if not temp_send_task.done():
-            temp_send_task.cancel()
-
-            if pfp:
-                embed.set_image(url=f'attachment://{filename}')
-                args['attachments'] = [pfp]
-            else:
-                embed.set_image(url=ATTACHMENTS['pfp_poo'].url)
+        if pfp:
+            embed.set_image(url=f'attachment://{filename}')
+            args['attachments'] = [pfp]
         else:
-            msg = temp_send_task.result()
-
-            # default fail
             embed.set_image(url=ATTACHMENTS['pfp_poo'].url)
 
-            if pfp:  # upload to another channel and get the attachment url
-                uploads = config.discord.uploads
-                channel = (self.bot.get_channel(uploads)
-                           or await self.bot.fetch_channel(uploads))
-                try:
-                    _up = await channel.send(file=pfp)
-                    embed.set_image(url=_up.attachments[0].url)
-                except Exception:  # just send poo
-                    pass
-
         # send the updated message
         msg = await self.bot.followup(interaction, **args)
 
         # start waiting for fame reactions
         if user:
-            self.bot.info_cache.add(msg.id, msg)
+            self.bot.info_cache.add(msg.id, InfoData(msg, fame, member))
 
     @slash_in_guild_channel()
     async def info_context_menu(
@@ -199,9 +213,97 @@ class Info(commands.Cog):
         """
         await self.info.callback(self, interaction, member)
 
-    async def _delayed_send(self, interaction, delay=3, **kwargs):
-        await asyncio.sleep(delay)
-        return await self.bot.followup(interaction, **kwargs)
+    async def _get_sprite(
+            self,
+            char: dict,
+            key: Optional[bytes] = None
+    ) -> Optional[bytes]:
+        """
+        Get the FeetCenter sprite for a character. The sprite only depends
+        on the character data, so cache by a hash of it
+
+        Parameters
+        ----------
+        char: dict
+            character data from database
+        key: Optional[bytes]
+            output of _char_key(char), if already computed
+
+        Returns
+        -------
+        Optional[bytes]
+            sprite data or None if maplestory.io failed
+
+        """
+        key = key or _char_key(char)
+
+        if key in self.bot.sprite_cache:
+            return self.bot.sprite_cache.get(key)
+
+        data = await mapleio.api.get_sprite(
+            Character.from_json(char), render_mode='FeetCenter',
+            session=self.bot.session
+        )
+
+        if data:
+            self.bot.sprite_cache.add(key, data)
+
+        return data
+
+    async def _build_pfp(
+            self,
+            char: dict
+    ) -> tuple[Optional[BytesIO], str]:
+        """
+        Get the profile picture for a character, or the not found picture
+        if no character
+
+        Parameters
+        ----------
+        char: dict
+            character data from database. Empty if no character
+
+        Returns
+        -------
+        tuple[Optional[BytesIO], str]
+            the profile picture (None if failed) and its filename
+
+        """
+        if not char:
+            attm = ATTACHMENTS['mushcharnotfound']
+            filename = f'{attm.filename.rsplit(".", 1)[0]}.webp'
+
+            if self._notfound_pfp:  # static, so only generated once
+                return BytesIO(self._notfound_pfp), filename
+
+            fetch = self.bot.download(attm.url, errors.DiscordIOError)
+        else:
+            filename = f'{char.get("name") or "char"}.webp'
+            char_key = _char_key(char)
+            pfp_key = (char_key, 'grassy_field')
+
+            if pfp_key in self._pfp_cache:  # same char already rendered
+                return BytesIO(self._pfp_cache.get(pfp_key)), filename
+
+            fetch = self._get_sprite(char, char_key)
+
+        # background does not depend on char, so download both at once
+        try:
+            data, _ = await asyncio.gather(fetch, self._get_background())
+        except errors.DiscordIOError:
+            data = None
+
+        if not data:
+            return None, filename
+
+        pfp_data = await self.gen_profile_pic(data)
+
+        if not char:
+            self._notfound_pfp = pfp_data.getvalue()
+        else:
+            self._pfp_cache.add(pfp_key, pfp_data.getvalue())
+
+        return pfp_data, filename
 
     async def gen_profile_pic(
             self,
@@ -209,7 +311,7 @@ class Info(commands.Cog):
             bg: str = 'grassy_field',
             w=250,
             h=150
-    ) -> bytes:
+    ) -> BytesIO:
         """
         Create a profile picture with the char data and background specified
 
@@ -226,11 +328,67 @@ class Info(commands.Cog):
 
         Returns
         -------
-        bytes
-            bytes of the generated profile picture
+        BytesIO
+            buffer of the generated profile picture, ready to be read
+
+        """
+        tile = await self._get_background(bg, w, h)
 
+        # PIL work is CPU bound; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.bot.executor, self._compose,
+                                          data, tile)
+
+    async def _get_background(
+            self,
+            bg: str = 'grassy_field',
+            w: int = 250,
+            h: int = 150
+    ) -> BackgroundTile:
         """
-        # get background
+        Get the bottom center w x h of a background. Backgrounds are static,
+        so each is only downloaded, decoded, and cropped once a day
+
+        Parameters
+        ----------
+        bg: str
+            discord attachment to lookup or url
+        w: int
+            width
+        h: int
+            height
+
+        Returns
+        -------
+        BackgroundTile
+            the cropped RGBA background, pixels from bottom for ground, and
+            the odd pixel left over when centering the crop
+
+        """
+        key = (bg, w, h)
+        tile = self._bg_tiles.get(key)
+
+        if tile:
+            return tile
+
+        # callers of the same key share one download. other keys never wait
+        task = self._bg_pending.get(key)
+
+        if not task:
+            task = asyncio.create_task(self._load_background(bg, w, h))
+            task.add_done_callback(lambda _: self._bg_pending.pop(key, None))
+            self._bg_pending[key] = task
+
+        # one caller cancelling should not cancel the shared download
+        return await asyncio.shield(task)
+
+    async def _load_background(
+            self,
+            bg: str,
+            w: int,
+            h: int
+    ) -> BackgroundTile:
+        """Download, decode, and crop a background. See _get_background"""
         if bg in BACKGROUNDS:
             attm, y_ground = BACKGROUNDS[bg]
             url = attm.url
@@ -238,19 +396,57 @@ class Info(commands.Cog):
             url, y_ground = bg, 0
 
         bg_data = await self.bot.download(url)
-        bg = Image.open(BytesIO(bg_data)).convert('RGBA')
+        bg_img = imutils.open_rgba(bg_data)
+        w_bg, h_bg = bg_img.size
+        box = ((w_bg - w)//2, h_bg - h, (w_bg + w)//2, h_bg)
+        x_pad = (w_bg - w) % 2  # to center sprite on full bg
+        tile = BackgroundTile(bg_img.crop(box), y_ground, x_pad)
+        self._bg_tiles.add((bg, w, h), tile)
+        return tile
+
+    @staticmethod
+    def _compose(
+            data: bytes,
+            tile: BackgroundTile
+    ) -> BytesIO:
+        """
+        Synchronous part of gen_profile_pic. Paste char onto background
 
-        # gen pfp
-        w_bg, h_bg = bg.size
-        pfp_data = imutils.apply_background(
-            data, bg, y_ground=y_ground, crop=False
-        )
-        pfp = Image.open(BytesIO(pfp_data)).convert('RGBA')
-        pfp = pfp.crop(((w_bg - w)//2, (h_bg - h), (w_bg + w)//2, h_bg))
+        Parameters
+        ----------
+        data: bytes
+            character data (should be FeetCenter)
+        tile: BackgroundTile
+            cropped background from _get_background. Not modified
 
+        Returns
+        -------
+        BytesIO
+            buffer of the generated profile picture, ready to be read
+
+        """
+        im = imutils.open_rgba(data)
+        w_im, h_im = im.size
+        w, h = tile.image.size
+
+        # paste center horizontal. feet (half height) on ground
+        x = (w + tile.x_pad - w_im)//2
+        y = h - h_im + h_im//2 - tile.y_ground
+        pfp = tile.image.copy()
+
+        # alpha over instead of masked paste, which would also blend the
+        # alpha channel. dest must be in bounds, so shift into source
+        dest = (max(x, 0), max(y, 0))
+        source = (max(-x, 0), max(-y, 0))
+        pfp.alpha_composite(im, dest=dest, source=source)
+
+        # short lived discord upload, so favor encode speed. lossless
+        # webp is both faster and smaller than png and keeps pixel art crisp
         byte_arr = BytesIO()
-        pfp.save(byte_arr, format='PNG')
-        return byte_arr.getvalue()
+        method = config.core.pfp_webp_method
+        pfp.save(byte_arr, format='WebP', lossless=True, method=method)
+        byte_arr.seek(0)
+        return byte_arr
 
     @set_group.command(name="info")
     @app_commands.autocomplete(job=contains(mapleio.JOBS),
@@ -279,8 +475,12 @@ class Info(commands.Cog):
             your guild
 
         """
-        input = locals().copy()
-        input['game'] = input['game'].value if input['game'] else None  # enum
+        input = {
+            'job': job,
+            'game': game.value if game else None,  # enum
+            'server': server,
+            'guild': guild
+        }
         user = await self.bot.db.get_user(interaction.user.id)
 
         if not user or not user['chars']:
@@ -306,10 +506,10 @@ class Info(commands.Cog):
 
         # validate input. can be NA
         update, invalid = {}, []
-        to_validate = {  # key, list
-            'job': mapleio.JOBS,
-            'game': [x.name for x in Games],
-            'server': mapleio.SERVERS,
+        to_validate = {  # key, valid values
+            'job': VALID_JOBS,
+            'game': VALID_GAMES,
+            'server': VALID_SERVERS,
         }
 
         for k, valid in to_validate.items():
@@ -329,8 +529,8 @@ class Info(commands.Cog):
 
         # update database
         if update:
-            char.update(update)
-            _update = {'chars': user['chars']}
+            prefix = f"chars.{user['default']}"
+            _update = {f'{prefix}.{k}': v for k, v in update.items()}
             ret = await self.bot.db.set_user(interaction.user.id, _update)
 
             if ret and ret.acknowledged:
@@ -344,8 +544,7 @@ class Info(commands.Cog):
         if invalid:
             text = 'The following issues occurred:\n\u200b'
             embed = discord.Embed(description=text, color=config.core.embed_color)
-            mushshock = self.bot.get_emoji(EMOJIS['mushshock'].id).url
-            embed.set_thumbnail(url=mushshock)
+            embed.set_thumbnail(url=EMOJIS['mushshock'].url)
             embed.set_author(name='Warning',
                              icon_url=self.bot.user.display_avatar.url)
 
@@ -390,12 +589,13 @@ class Info(commands.Cog):
         if not user or not user['chars']:
             raise errors.NoCharacters
 
-        # update
+        # update only the changed fields
         char = user['chars'][user['default']]
-        char['action'] = pose or char['action']
-        char['emotion'] = expression or char['emotion']
-
-        update = {'chars': user['chars']}
+        prefix = f"chars.{user['default']}"
+        update = {
+            f'{prefix}.action': pose or char['action'],
+            f'{prefix}.emotion': expression or char['emotion']
+        }
         ret = await self.bot.db.set_user(interaction.user.id, update)
 
         if ret and ret.acknowledged:
@@ -427,7 +627,10 @@ class Info(commands.Cog):
         if user.id == target.id and user.id != self.bot.owner_id:
             raise errors.SelfFameError
 
-        _target = await self.bot.db.get_user(target.id)
+        # one query for both (or none if cached)
+        users = await self.bot.db.get_users([target.id, user.id])
+        _target, famer = users.get(target.id), users.get(user.id)
+
         if not _target:
             msg = f'{target.display_name} has not used {config.core.bot_name}'
             raise errors.NoCharacters(msg)
@@ -439,7 +642,6 @@ class Info(commands.Cog):
             await self.bot.db.set_user(target.id, target_update)
         else:
             # regular user
-            famer = await self.bot.db.get_user(user.id)
             if not famer:
                 ret = await self.bot.db.add_user(user.id)
                 if not ret.acknowledged:
@@ -455,7 +657,7 @@ class Info(commands.Cog):
                 raise errors.AlreadyFamedError
 
             # negative amount is a defame. cnt is separate for each
-            cnt = len(famer_log.fames() if amt > 1 else famer_log.defames())
+            cnt = len(famer_log.fames() if amt > 0 else famer_log.defames())
 
             if cnt >= config.core.fame_daily_limit:
                 raise errors.MaxFamesReached
@@ -543,9 +745,9 @@ class Info(commands.Cog):
         """
         react = payload.emoji.name.lower()
 
-        if react == '\U0001f44E' or _contains_all(react, ['thumb', 'down']):
+        if react == THUMBS_DOWN or _contains_all(react, THUMBS_DOWN_WORDS):
             amt = -1
-        elif react == '\U0001f44D' or _contains_all(react, ['thumb', 'up']):
+        elif react == THUMBS_UP or _contains_all(react, THUMBS_UP_WORDS):
             amt = 1
         else:
             return  # neither a thumbs up nor thumbs down
@@ -553,8 +755,8 @@ class Info(commands.Cog):
         try:
             # get message
             if payload.message_id in self.bot.info_cache:
-                message = self.bot.info_cache.get(payload.message_id)
-                self.bot.info_cache.refresh(payload.message_id)  # extend
+                info = self.bot.info_cache.get(payload.message_id)
+                message, fame, target = info
             else:
                 channel = self.bot.get_channel(payload.channel_id)
                 message = await channel.fetch_message(payload.message_id)
@@ -566,40 +768,33 @@ class Info(commands.Cog):
                 ):
                     return  # not an info message
 
-                # add to cache
-                self.bot.info_cache.add(payload.message_id, message)
+                # only parse fame and target on cache miss
+                field = message.embeds[0].fields[1].value
+                fame = int(FAME_NUM_RE.search(field).group())
+                target = _info_target(message.embeds[0], self.bot)
 
-            embed = message.embeds[0]
-            display_name = embed.author.name.replace("'s Info", '')
-
-            # determine target from thumbnail (params or after /avatars/)
-            url = embed.thumbnail.url
-            params = dict(parse_qsl(urlparse(url).query))
-            _id = params['uid'] if 'uid' in params else url.split('/')[-2]
-
-            # fallback on title, though users can change name
-            if not _id or not _id.isnumeric():
-                name, disc = embed.title.split('#')
-                target = discord.utils.get(
-                    self.bot.get_all_members(),
-                    name=name,
-                    discriminator=disc
-                )
-            else:
-                target = PartialMember(
-                    id=int(_id),
-                    display_name=display_name
-                )
+                if not target:  # cant determine target
+                    return
 
-            if not target:  # cant determine target
-                return
+                self.bot.info_cache.add(payload.message_id,
+                                        InfoData(message, fame, target))
+
+            embed = message.embeds[0]
 
             # fame and update embed. note: does not pull fame cnt from db
             await self._fame(payload.member, target, amt)
-            curr = re.search(r'\d+', embed.fields[1].value).group()
-            _fmt_fame = _padded_str(f'\u2b50 {int(curr) + amt}', n=12)
+
+            # reread after the await so concurrent reactions build on each
+            # other. no await between this read and the add below
+            info = self.bot.info_cache.get(payload.message_id)
+            fame = (info.fame if info else fame) + amt
+            _fmt_fame = _padded_str(f'\u2b50 {fame}', n=12)
             embed.set_field_at(1, name='Fame', value=_fmt_fame + '\n\u200b')
 
+            # cache with new fame. also extends expiry
+            info = InfoData(message, fame, target)
+            self.bot.info_cache.add(payload.message_id, info)
+
             # attached pfp pops out of embed, so remove
             await message.edit(embed=embed, attachments=[])
 
@@ -607,10 +802,99 @@ class Info(commands.Cog):
             pass  # ideally would DM or ephemeral (but no interaction)
 
 
+def _info_target(
+        embed: discord.Embed,
+        bot: commands.Bot
+) -> Optional[Union[discord.Member, PartialMember]]:
+    """
+    Determine the member an info embed belongs to
+
+    Parameters
+    ----------
+    embed: discord.Embed
+        the info embed
+    bot: commands.Bot
+        the bot, for looking up members by name
+
+    Returns
+    -------
+    Optional[Union[discord.Member, PartialMember]]
+        the member or None if it cannot be determined
+
+    """
+    display_name = embed.author.name.replace("'s Info", '')
+
+    # determine target from thumbnail (params or after /avatars/)
+    url = embed.thumbnail.url
+    params = dict(parse_qsl(urlparse(url).query))
+    _id = params['uid'] if 'uid' in params else url.split('/')[-2]
+
+    # fallback on title, though users can change name
+    if not _id or not _id.isnumeric():
+        name, disc = embed.title.split('#')
+        return discord.utils.get(
+            bot.get_all_members(),
+            name=name,
+            discriminator=disc
+        )
+
+    return PartialMember(id=int(_id), display_name=display_name)
+
+
 def _padded_str(text, n=30):
-    s = list('\xa0' * n)
-    s[:len(text)] = list(text)
-    return ''.join(s)
+    return text.ljust(n, '\xa0')
+
+
+_day_bounds = (0, 0)  # cached by _nyc_day_bounds
+
+
+def _nyc_day_bounds() -> tuple[int, int]:
+    """
+    Start and end of the current New York day as epoch seconds,
+    comparable to fame timestamps. Only recomputed once the day ends
+
+    """
+    global _day_bounds
+
+    if not _day_bounds[0] <= time.time() < _day_bounds[1]:
+        today = datetime.now(NYC).date()
+        tomorrow = today + timedelta(days=1)
+        start = datetime(today.year, today.month, today.day, tzinfo=NYC)
+        end = datetime(tomorrow.year, tomorrow.month, tomorrow.day,
+                       tzinfo=NYC)
+        _day_bounds = (int(start.timestamp()), int(end.timestamp()))
+
+    return _day_bounds
+
+
+def _epoch(ts: Union[int, datetime]) -> int:
+    """Fame timestamp as epoch seconds. Older records are naive utc"""
+    return ts if isinstance(ts, int) else int(utc(ts).timestamp())
+
+
+def _first_since(fames: list, start: int) -> int:
+    """
+    Index of the first fame record at or after start. Records are appended
+    in time order, so walk back from the newest and stop at the first
+    older one; today's records are few and old ones are never converted
+
+    """
+    i = len(fames)
+
+    while i and _epoch(fames[i - 1][2]) >= start:
+        i -= 1
+
+    return i
+
+
+def _char_key(char: dict) -> bytes:
+    """
+    Content hash of character data. Edited chars get a new key, so
+    caches keyed by it never need invalidating
+
+    """
+    data = orjson.dumps(char, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 def _contains_all(string, iterable):
@@ -674,67 +958,68 @@ FameRecord = namedtuple('FameRecord', 'uid amt ts')
 class FameLog:
     """
     Log of fames made and famers (mostly for viewing).  Keep track of
-    userid, amount, and timestamp. timestamp is output of datetime.utcnow()
-    (i.e. tz unaware, but utc)
+    userid, amount, and timestamp. timestamp is int epoch seconds. Records
+    stored as naive utc datetimes are converted on read
 
     Records that are not from today are removed on init.  Slight inconsistency
     if time between init and operation crosses midnight
 
     """
+    __slots__ = ('_fames', '_uids', '_pos', '_neg', '_famers', '_defamers')
+
     def __init__(self, fames: list, famers: Optional[list] = None):
-        utcnow = utc(datetime.utcnow())
-        today = utcnow.astimezone(NYC).date()
+        start, end = _nyc_day_bounds()
         famers = famers or []
 
-        # clean old records. iterate over copy
-        self._fames = [FameRecord(*fame) for fame in fames
-                       if utc(fame[-1]).astimezone(NYC).date() == today]
+        # clean old records. integer compare; no tz per record
+        fames = fames[_first_since(fames, start):]
+        records = (FameRecord(uid, amt, _epoch(ts)) for uid, amt, ts in fames)
+        self._fames = [fame for fame in records if fame.ts < end]
+        self._uids = {fame.uid for fame in self._fames}  # for __contains__
 
-        self._famers, self._defamers = [], []
-        famers.sort(key=lambda x: x[1], reverse=True)
+        # partitioned views so counting is len(). _fames keeps order
+        self._pos = [fame for fame in self._fames if fame.amt > 0]
+        self._neg = [fame for fame in self._fames if fame.amt < 0]
 
-        for fame in famers:
-            _fame = FameRecord(*fame)
-            lst = self._famers if _fame.amt > 0 else self._defamers
+        # most recent famers/defamers. oldest drop off when full
+        n = config.core.fame_log_length
+        self._famers, self._defamers = deque(maxlen=n), deque(maxlen=n)
 
-            if len(self._famers) <= config.core.fame_log_length:
-                lst.append(_fame)
+        for uid, amt, ts in famers:
+            lst = self._famers if amt > 0 else self._defamers
+            lst.append(FameRecord(uid, amt, _epoch(ts)))
 
     def fames(self):
-        return [fame for fame in self._fames if fame.amt > 0]
+        return self._pos
 
     def defames(self):
-        return [fame for fame in self._fames if fame.amt < 0]
+        return self._neg
 
     def __contains__(self, uid):
-        for fame in self._fames:
-            if fame.uid == uid:
-                return True
-
-        return False
+        return uid in self._uids
 
     def add_fame(self, uid):
-        self._fames.append(FameRecord(uid, 1, datetime.utcnow()))
+        record = FameRecord(uid, 1, int(time.time()))
+        self._fames.append(record)
+        self._pos.append(record)
+        self._uids.add(uid)
 
     def add_defame(self, uid):
-        self._fames.append(FameRecord(uid, -1, datetime.utcnow()))
+        record = FameRecord(uid, -1, int(time.time()))
+        self._fames.append(record)
+        self._neg.append(record)
+        self._uids.add(uid)
 
     def add_famer(self, uid):
-        if len(self._famers) == config.core.fame_log_length:
-            self._famers.pop()
-
-        self._famers.append(FameRecord(uid, 1, datetime.utcnow()))
+        self._famers.append(FameRecord(uid, 1, int(time.time())))
 
     def add_defamer(self, uid):
-        if len(self._defamers) == config.core.fame_log_length:
-            self._defamers.pop()
-
-        self._defamers.append(FameRecord(uid, -1, datetime.utcnow()))
+        self._defamers.append(FameRecord(uid, -1, int(time.time())))
 
     def to_json(self):
         return {
             'fames': self._fames,
-            'famers': self._famers + self._defamers
+            'famers': list(chain(self._famers, self._defamers))
         }
 
 
@@ -83,7 +83,7 @@ class List(commands.Cog):
         )
 
         embed.set_author(name='Emotes', icon_url=self.bot.user.display_avatar.url)
-        thumbnail = self.bot.get_emoji(EMOJIS['mushcheers'].id).url
+        thumbnail = EMOJIS['mushcheers'].url
         embed.set_thumbnail(url=thumbnail)
         embed.add_field(name='Animated Emotes', value='')
         embed.set_image(url=ATTACHMENTS['animated_emotes_preview'].url)
@@ -114,7 +114,7 @@ class List(commands.Cog):
 
         embed.set_author(name='Expressions',
                          icon_url=self.bot.user.display_avatar.url)
-        thumbnail = self.bot.get_emoji(EMOJIS['mushcheers'].id).url
+        thumbnail = EMOJIS['mushcheers'].url
         embed.set_thumbnail(url=thumbnail)
         embed.set_footer(text='[GMS v240]')
 
@@ -153,7 +153,7 @@ class List(commands.Cog):
         )
 
         embed.set_author(name='Poses', icon_url=self.bot.user.display_avatar.url)
-        embed.set_thumbnail(url=self.bot.get_emoji(EMOJIS['mushdab'].id).url)
+        embed.set_thumbnail(url=EMOJIS['mushdab'].url)
         embed.set_footer(text='[GMS v240]')
 
         label = 'Raw Values' if show_values else 'Poses'
@@ -222,6 +222,7 @@ class CharacterScrollView(discord.ui.View):
         self.curr = user['default']
         self.embed = embed
         self._n = len(user['chars'])
+        self._names = _fmt_char_names(user)  # only bold changes per click
 
     def get_button(self, label: str):
         return next(x for x in self.children if x.label == label)
@@ -237,7 +238,8 @@ class CharacterScrollView(discord.ui.View):
         set_default.disabled = self.curr == self.user['default']
 
         # update list
-        chars = _fmt_char_names(self.user, self.curr)
+        chars = self._names.copy()
+        chars[self.curr] = _bold_char_name(self.user, self.curr)
         self.embed.set_field_at(0, name='Characters', value='\n'.join(chars))
 
         # update image
@@ -290,21 +292,32 @@ class CharacterScrollView(discord.ui.View):
         await self.orig_interaction.edit_original_response(view=self)
 
 
-def _fmt_char_names(user: dict, bold_i: int):
+def _fmt_char_names(user: dict, bold_i: Optional[int] = None):
     """Format char names for chars embed"""
     char_names = ['\u2727'] * config.core.max_chars  # placeholder
 
     # add bullets and bold current selection
-    for i, char in enumerate(user['chars']):
-        default = '{} (default)' if i == user['default'] else '{}'
-        bold = '\u2726 \u200b **{}**' if i == bold_i else '\u2727 \u200b {}'
-        char_names[i] = bold.format(default).format(char['name'])
+    for i in range(len(user['chars'])):
+        char_names[i] = '\u2727 \u200b {}'.format(_char_name(user, i))
+
+    if bold_i is not None:
+        char_names[bold_i] = _bold_char_name(user, bold_i)
 
     # extra space
     char_names += ['\u200b']
     return char_names
 
 
+def _bold_char_name(user: dict, i: int):
+    """Format the current selection for chars embed"""
+    return '\u2726 \u200b **{}**'.format(_char_name(user, i))
+
+
+def _char_name(user: dict, i: int):
+    name = user['chars'][i]['name']
+    return f'{name} (default)' if i == user['default'] else name
+
+
 class EmotesPreview(discord.ui.View):
     def __init__(
             self,
@@ -9,6 +9,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from typing import Union
+from itertools import islice
 
 from ... import config, mapleio
 from ...mapleio.character import Character
@@ -86,9 +87,13 @@ def contains(choices: Union[list, dict]):
     if isinstance(choices, list):
         choices = dict(zip(choices, choices))
 
+    # lowercase and build choices once, not per keypress
+    _choices = tuple((k.lower(), app_commands.Choice(name=k, value=v))
+                     for k, v in choices.items())
+
     async def wrapper(interaction, current):
-        return [app_commands.Choice(name=k, value=v)
-                for k, v in choices.items()
-                if current.lower() in k.lower()][:25]
+        current = current.lower()
+        matches = (choice for k, choice in _choices if current in k)
+        return list(islice(matches, 25))
 
     return wrapper
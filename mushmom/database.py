@@ -96,11 +96,49 @@ class Database:
                 _data = self.user_cache.get(userid)
                 return self._handle_proj(_data, projection)
             else:
-                data = await self.users.find_one({'_id': userid}, projection)
+                # cache the full document so later calls with a different
+                # projection can still be served from the cache
+                data = await self.users.find_one({'_id': userid})
                 if data:
                     self.user_cache.add(userid, data)
+                    return self._handle_proj(data, projection)
                 return data
 
+    async def get_users(
+            self,
+            userids: Iterable[int]
+    ) -> dict[int, dict]:
+        """
+        Returns data for several users. Uncached users are fetched in a
+        single query
+
+        Parameters
+        ----------
+        userids: Iterable[int]
+            the discord user ids
+
+        Returns
+        -------
+        dict[int, dict]
+            userid to user data for users that were found
+
+        """
+        found, missing = {}, []
+
+        for userid in userids:
+            if userid in self.user_cache:
+                found[userid] = self.user_cache.get(userid)
+            else:
+                missing.append(userid)
+
+        if missing:
+            cursor = self.users.find({'_id': {'$in': missing}})
+            for data in await cursor.to_list(length=len(missing)):
+                self.user_cache.add(data['_id'], data)
+                found[data['_id']] = data
+
+        return found
+
     async def add_user(
             self,
             userid: int,
@@ -149,8 +187,8 @@ class Database:
             data: dict,
     ) -> UpdateResult:
         """
-        Set/update user data fields.  Invalidate cache since user can
-        do a partial update, which is difficult to handle
+        Set/update user data fields.  Keys can be dotted paths like
+        MongoDB (e.g. `chars.0.job`), which are applied to the cache too
 
         Parameters
         ----------
@@ -179,7 +217,90 @@ class Database:
 
         # update cache
         if userid in self.user_cache:
-            self.user_cache.get(userid).update(data)
+            _data = self.user_cache.get(userid)
+            for k, v in data.items():
+                _set_path(_data, k, v)
+
+        return r
+
+    async def push_char(
+            self,
+            userid: int,
+            char_data: dict,
+            data: Optional[dict] = None
+    ) -> UpdateResult:
+        """
+        Append a character to the user's chars without sending the rest
+        of the array
+
+        Parameters
+        ----------
+        userid: int
+            the discord user id
+        char_data: dict
+            output of Character.to_dict()
+        data: Optional[dict]
+            other fields to set in the same update (e.g. default)
+
+        Returns
+        -------
+        UpdateResult
+            the result of updating the user
+
+        """
+        data = data or {}
+        update = {'$push': {'chars': char_data}}
+        if data:
+            update['$set'] = data
+
+        r = await self.users.update_one({'_id': userid}, update)
+
+        # update cache
+        if userid in self.user_cache:
+            _data = self.user_cache.get(userid)
+            _data['chars'].append(char_data)
+            _data.update(data)
+
+        return r
+
+    async def replace_char(
+            self,
+            userid: int,
+            index: int,
+            char_data: dict,
+            data: Optional[dict] = None
+    ) -> UpdateResult:
+        """
+        Replace the character at index without sending the rest of the
+        array
+
+        Parameters
+        ----------
+        userid: int
+            the discord user id
+        index: int
+            position in chars to replace
+        char_data: dict
+            output of Character.to_dict()
+        data: Optional[dict]
+            other fields to set in the same update (e.g. default)
+
+        Returns
+        -------
+        UpdateResult
+            the result of updating the user
+
+        """
+        data = data or {}
+        update = {'$set': {f'chars.{index}': char_data, **data}}
+
+        r = await self.users.update_one({'_id': userid}, update)
+
+        # update cache
+        if userid in self.user_cache:
+            _data = self.user_cache.get(userid)
+            _data['chars'][index] = char_data
+            _data.update(data)
 
         return r
 
@@ -213,7 +334,9 @@ class Database:
         # update cache
         for userid, data in ops.items():
             if userid in self.user_cache:
-                self.user_cache.get(userid).update(data)
+                _data = self.user_cache.get(userid)
+                for k, v in data.items():
+                    _set_path(_data, k, v)
 
         return r
 
@@ -412,3 +535,18 @@ class Database:
 
     def close(self):  # not coroutine
         self.client.close()
+
+
+def _set_path(d: dict, key: str, value) -> None:
+    """
+    Set a value in nested dicts/lists by MongoDB dotted path
+
+    """
+    *path, last = key.split('.')
+    for k in path:
+        d = d[int(k)] if isinstance(d, list) else d[k]
+
+    if isinstance(d, list):
+        d[int(last)] = value
+    else:
+        d[last] = value
@@ -6,6 +6,7 @@ import aiohttp
 import asyncio
 import functools
 import zipfile
+import orjson
 
 from PIL import Image, ImageOps
 from io import BytesIO
@@ -64,7 +65,7 @@ async def latest_version(
 
     async with session.get(u) as r:
         if r.status == 200:
-            data = await r.json()
+            data = await r.json(loads=orjson.loads)
             region_data = [x for x in data if x['isReady'] and x['region'] == region]
             latest = region_data[-1]['mapleVersionId']
         else:
@@ -105,7 +106,7 @@ async def get_item(
     # http request
     async with session.get(u) as r:
         if r.status == 200:
-            return await r.json()
+            return await r.json(loads=orjson.loads)
 
 
 @with_session
@@ -6,6 +6,7 @@ in order to read in and recreate API calls
 from __future__ import annotations
 
 import json
+import orjson
 from urllib import parse
 from aenum import Enum, IntEnum, auto, extend_enum
 from typing import Union, Optional, Any, Iterable
@@ -108,7 +109,7 @@ class Character:
 
         """
         if isinstance(data, (str, bytes)):
-            data = json.loads(data)
+            data = orjson.loads(data)
 
         char = Character()
         char.name = data.get('name')
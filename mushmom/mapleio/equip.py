@@ -5,6 +5,8 @@ in order to read in and recreate API calls
 """
 from __future__ import annotations
 
+import functools
+
 from collections import namedtuple
 from typing import Optional, Union, Any
 
@@ -109,9 +111,11 @@ class Equip:
         return d
 
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def get_equip_type(cls, itemid: Union[int, str]) -> str:
         """
-        Gets the EquipType if any
+        Gets the EquipType if any. Memoized since every Equip built from
+        stored char data does a linear scan of EQUIP_TYPES
 
         Parameters
         ----------
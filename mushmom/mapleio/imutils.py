@@ -11,6 +11,25 @@ from itertools import cycle
 from io import BytesIO
 
 
+def open_rgba(data: bytes) -> Image.Image:
+    """
+    Fully decode image data as RGBA, so nothing holds on to the buffer
+
+    Parameters
+    ----------
+    data: bytes
+      encoded image data
+
+    Returns
+    -------
+    Decoded RGBA image
+
+    """
+    im = Image.open(BytesIO(data))
+    im.load()  # decode now rather than lazily on first pixel access
+    return im if im.mode == 'RGBA' else im.convert('RGBA')
+
+
 def min_width(img: Image.Image, width: int) -> Image.Image:
     """
     Ensure image is wider than min width
@@ -174,8 +193,9 @@ def apply_background(
         bg: Union[bytes, Image.Image, str],
         y_feet: Optional[int] = None,
         y_ground: Optional[int] = None,
-        crop: bool = True
-) -> Optional[bytes]:
+        crop: bool = True,
+        return_image: bool = False
+) -> Optional[Union[bytes, Image.Image]]:
     """
     Apply background to the image
 
@@ -184,29 +204,33 @@ def apply_background(
     im: Union[bytes, Image]
         character data (should be FeetCenter)
     bg: Union[bytes, Image, tuple]
-        background image data or RGBA color
+        background image data or RGBA color. An Image is not modified
     y_feet: Optional[int]
         pixels from bottom for feet in source image.  Default half height
     y_ground: Optional[int]
         pixels from bottom for ground in background.  Default max y
     crop: bool
         whether or not to crop to original size
+    return_image: bool
+        return the Image instead of encoding to PNG bytes
 
     Returns
     -------
-    Optional[bytes]
-        bytes of the generated image
+    Optional[Union[bytes, Image.Image]]
+        bytes of the generated image (or Image if return_image)
 
     """
     # format image
     if isinstance(im, bytes):
-        im = Image.open(BytesIO(im))
+        im = open_rgba(im)
+    elif im.mode != 'RGBA':
+        im = im.convert('RGBA')
 
     w_im, h_im = im.size
 
     # format bg
     if isinstance(bg, bytes):
-        bg = Image.open(BytesIO(bg)).convert('RGBA')
+        bg = open_rgba(bg)
     elif isinstance(bg, tuple):
         bg = Image.new('RGBA', im.size, bg)
 
@@ -219,13 +243,25 @@ def apply_background(
     if ((h_im-y_feet) > (h_bg-y_ground)) | (w_im > w_bg):
         return
 
-    # paste center horizontal. vertical adjust for feet and ground pos
+    # center horizontal. vertical adjust for feet and ground pos. bg is
+    # never modified, so a decoded background can be reused across frames
     x1, y1 = (w_bg - w_im)//2, (h_bg - h_im + y_feet - y_ground)
-    bg.paste(im, (x1, y1), mask=im)
 
-    if crop:  # recrop
+    # part of im that lands on bg
+    box = (max(-x1, 0), max(-y1, 0),
+           min(w_im, w_bg - x1), min(h_im, h_bg - y1))
+
+    if crop:
         bg = bg.crop((x1, y1, x1 + w_im, y1 + h_im))
+        bg.alpha_composite(im, box[:2], box)
+    else:
+        bg = bg.copy()
+        bg.alpha_composite(im, (x1 + box[0], y1 + box[1]), box)
+
+    if return_image:  # skip encode if caller keeps working on it
+        return bg
 
+    # intermediate output, so favor encode speed over size
     byte_arr = BytesIO()
-    bg.save(byte_arr, format='PNG')
+    bg.save(byte_arr, format='PNG', compress_level=1)
     return byte_arr.getvalue()
@@ -8,11 +8,17 @@ from importlib import resources
 from collections import namedtuple
 
 # simple models
-Emoji = namedtuple('Emoji', 'id')
+Emoji = namedtuple('Emoji', 'id animated url')
 Attachment = namedtuple('Attachment', 'channel_id id filename url')
 Background = namedtuple('Background', 'attachment y_ground')
 
 
+def _fmt_emoji(emoji_id, animated):
+    ext = 'gif' if animated else 'png'  # png would drop animation
+    url = f'https://cdn.discordapp.com/emojis/{emoji_id}.{ext}'
+    return Emoji(emoji_id, animated, url)
+
+
 def _fmt_attm(channel_id, attachment_id, filename):
     path = 'https://cdn.discordapp.com/attachments'
     url = f'{path}/{channel_id}/{attachment_id}/{filename}'
@@ -23,7 +29,7 @@ with resources.open_binary(__package__, 'discord.yaml') as fp:
     _discord = yaml.safe_load(fp)
 
 # constant dicts to of resources
-EMOJIS = {k: Emoji(v) for k, v in _discord['emojis'].items()}
+EMOJIS = {k: _fmt_emoji(*v) for k, v in _discord['emojis'].items()}
 ATTACHMENTS = {k: _fmt_attm(*v) for k, v in _discord['attachments'].items()}
 BACKGROUNDS = {
     k: Background(_fmt_attm(*v['attm']), v['y_ground'])